@@ -1,6 +1,8 @@
-from typing import TypeGuard, override
+import inspect
+from typing import Any, TypeGuard, override
 
-from app.subroutines.http import Response, SimpleRequest, SimpleResponse
+from app.exceptions import ParseError
+from app.subroutines.http import Response, SimpleRequest, SimpleResponse, StreamingResponse
 from app.types_ import (
     AnyScope,
     AsyncCallable,
@@ -15,13 +17,27 @@ from app.types_ import (
 from .base import RouteComponent as _RouteComponent
 
 
+def _request_param(fn: AsyncCallable[..., Any]) -> str | None:
+    """Name of the route target parameter annotated `SimpleRequest`, if any."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    for p in params:
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) and p.annotation in (SimpleRequest, "SimpleRequest"):
+            return p.name
+    return None
+
+
 class HTTPComponent(
     _RouteComponent[HTTPScope, ReceiveHTTP, dict[str, RouteMapping[Response]], Response]
 ):
     routes: dict[str, RouteMapping[Response]]
+    request_params: dict[tuple[str, str], str]
 
     def __init__(self) -> None:
         self.routes = {}
+        self.request_params = {}
         super().__init__()
 
     @override
@@ -37,23 +53,40 @@ class HTTPComponent(
             pass
 
         print(scope, req.body)
-        resp = await self.route_dispatch(scope, receive, send)
+        try:
+            resp = await self.route_dispatch(scope, receive, send, request=req)
+        except ParseError:
+            resp = Response(status=400, body=b"400 Bad Request\n")
         if resp is None:
             resp = Response(status=404, body=b"404 Not Found\n")
 
         async with SimpleResponse(send).prepare(
             resp.status, headers=resp.headers
         ) as rsp:
-            await rsp.finish(resp.body if resp.body is not None else b"")
+            if isinstance(resp, StreamingResponse):
+                async for chunk in resp.iter_body():
+                    await rsp.part(chunk)
+                await rsp.finish()
+            else:
+                await rsp.finish(resp.body if resp.body is not None else b"")
 
         return None
 
     @override
     async def route_dispatch(
-        self, scope: HTTPScope, receive: Receive[ReceiveHTTP], send: Send
+        self,
+        scope: HTTPScope,
+        receive: Receive[ReceiveHTTP],
+        send: Send,
+        *,
+        request: SimpleRequest | None = None,
     ) -> Response | None:
-        for k, callee in self.routes[scope["method"].upper()].items():
+        """Route dispatcher. Targets with a parameter annotated `SimpleRequest` receive `request`."""
+        method = scope["method"].upper()
+        for k, callee in self.routes[method].items():
             if scope["path"] == k:  # temporary impl.
+                if request is not None and (name := self.request_params.get((method, k))) is not None:
+                    return await callee(**{name: request})
                 return await callee()
 
     @override
@@ -62,6 +95,10 @@ class HTTPComponent(
         if type_ is None:
             raise ValueError("Route type `type_` is unset.")
         self.routes.setdefault(type_, {})[route] = target
+        if (name := _request_param(target)) is not None:
+            self.request_params[type_, route] = name
+        else:
+            _ = self.request_params.pop((type_, route), None)
 
     def route[T: AsyncCallable[..., Response]](
         self,
@@ -1,11 +1,145 @@
-from collections.abc import MutableMapping
+import json as _json
+import math
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, MutableMapping
 from dataclasses import InitVar, dataclass, field
 from http.cookies import BaseCookie
 from types import TracebackType
-from typing import Any, Self
+from typing import Any, ClassVar, Self, cast, override
 
-from app.exceptions import ConnectionClosed
-from app.types_ import CommonMapping, ReceiveHTTP, Send
+from app.exceptions import ConnectionClosed, ParseError
+from app.types_ import CommonMapping, JSONDecoder, JSONEncoder, ReceiveHTTP, Send
+
+_std_json_encoder = _json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def _finite_floats(obj: Any, parents: set[int]) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if not isinstance(obj, (dict, list, tuple)):
+        return obj
+    key = id(cast(object, obj))
+    if key in parents:
+        raise ValueError("Circular reference detected")
+    parents.add(key)
+    if isinstance(obj, dict):
+        res: Any = {k: _finite_floats(v, parents) for k, v in cast(dict[Any, Any], obj).items()}
+    else:
+        res = [_finite_floats(v, parents) for v in cast(list[Any] | tuple[Any, ...], obj)]
+    parents.remove(key)
+    return res
+
+
+def std_json_dumps(obj: Any) -> bytes:
+    """
+    Stdlib JSON encoder, used by default when orjson is not installed.
+
+    Like orjson, it writes compact UTF-8 and turns non-finite floats into `null`.
+    Lone surrogates, which orjson rejects, are written as `\\uXXXX` escapes.
+    Float formatting can still differ from orjson's.
+    """
+    try:
+        text = _std_json_encoder.encode(obj)
+    except ValueError:
+        # Retry with non-finite floats replaced; any other error is raised again.
+        text = _std_json_encoder.encode(_finite_floats(obj, set()))
+    # Only lone surrogates fail to encode, and they only appear inside strings.
+    return text.encode("utf-8", "backslashreplace")
+
+
+json_dumps: JSONEncoder
+json_loads: JSONDecoder
+
+try:
+    import orjson
+except ImportError:
+    json_dumps = std_json_dumps
+    json_loads = _json.loads
+else:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+
+
+def use_json_codec(dumps: JSONEncoder | None = None, loads: JSONDecoder | None = None) -> None:
+    """Replace the default JSON encoder and/or decoder used by requests and responses."""
+    global json_dumps, json_loads
+    if dumps is not None:
+        json_dumps = dumps
+    if loads is not None:
+        json_loads = loads
+
+
+async def _aiter[T](items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _encode_batch(dumps: JSONEncoder, batch: list[Any]) -> bytes:
+    out = dumps(batch).strip()
+    if out[:1] == b"[" and out[-1:] == b"]":
+        return out[1:-1]
+    # The encoder frames arrays in some other way, so encode item by item.
+    return b",".join(dumps(item).strip() for item in batch)
+
+
+def _take_chunks(buf: bytearray, chunk_size: int) -> list[bytes]:
+    """Remove and return as many whole `chunk_size` chunks as `buf` holds."""
+    end = len(buf) - len(buf) % chunk_size
+    chunks = [bytes(memoryview(buf)[i:i + chunk_size]) for i in range(0, end, chunk_size)]
+    del buf[:end]
+    return chunks
+
+
+async def iter_json_array(
+    items: Iterable[Any] | AsyncIterable[Any], encoder: JSONEncoder | None = None, chunk_size: int = 65536, batch_size: int = 256
+) -> AsyncIterator[bytes]:
+    """
+    Encode `items` incrementally as a JSON array, yielding `chunk_size` byte chunks and a shorter last one.
+
+    Items are encoded `batch_size` at a time as a list whose brackets are then stripped,
+    so the encoder is called once per batch instead of once per item. Whitespace the
+    encoder adds around its output is stripped.
+    """
+    dumps = encoder or json_dumps
+    buf = bytearray(b"[")
+    batch: list[Any] = []
+    sep = b""
+    async for item in _aiter(items):
+        batch.append(item)
+        if len(batch) < batch_size:
+            continue
+        buf += sep
+        buf += _encode_batch(dumps, batch)
+        sep = b","
+        batch.clear()
+        for chunk in _take_chunks(buf, chunk_size):
+            yield chunk
+    if batch:
+        buf += sep
+        buf += _encode_batch(dumps, batch)
+    buf += b"]"
+    for chunk in _take_chunks(buf, chunk_size):
+        yield chunk
+    if buf:
+        yield bytes(buf)
+
+
+async def iter_ndjson(
+    items: Iterable[Any] | AsyncIterable[Any], encoder: JSONEncoder | None = None, chunk_size: int = 65536
+) -> AsyncIterator[bytes]:
+    """Encode `items` incrementally as newline-delimited JSON, yielding `chunk_size` byte chunks and a shorter last one."""
+    dumps = encoder or json_dumps
+    buf = bytearray()
+    async for item in _aiter(items):
+        buf += dumps(item).strip()
+        buf += b"\n"
+        for chunk in _take_chunks(buf, chunk_size):
+            yield chunk
+    if buf:
+        yield bytes(buf)
 
 
 class SimpleRequest:
@@ -39,6 +173,15 @@ class SimpleRequest:
 
         return self.body_complete or self.done
 
+    def json(self, loads: JSONDecoder | None = None) -> Any:
+        """Decode the complete request body as JSON."""
+        if not self.body_complete:
+            raise ParseError("Request body is incomplete.")
+        try:
+            return (loads or json_loads)(self.body)
+        except ValueError as e:
+            raise ParseError(f"Invalid JSON body: {e}") from e
+
 
 class SimpleResponse:
     send: Send
@@ -136,3 +279,58 @@ class HTMLResponse(Response):
     def __post_init__(self, content_type: str | None, cookies: BaseCookie[bytes] | None, content: str, encoding: str) -> None:
         self.body: bytes | None = content.encode(encoding)
         return super().__post_init__("text/html", cookies)
+
+
+@dataclass
+class JSONResponse(Response):
+    content: InitVar[Any] = None
+    encoder: InitVar[JSONEncoder | None] = None
+
+    def __post_init__(self, content_type: str | None, cookies: BaseCookie[bytes] | None, content: Any, encoder: JSONEncoder | None) -> None:
+        self.body: bytes | None = (encoder or json_dumps)(content)
+        return super().__post_init__("application/json" if content_type is None else content_type, cookies)
+
+
+@dataclass
+class StreamingResponse(Response):
+    body: bytes | None = field(init=False, default=None)
+    content: InitVar[Iterable[bytes] | AsyncIterable[bytes]] = ()
+    stream: Iterable[bytes] | AsyncIterable[bytes] = field(init=False, repr=False)
+
+    def __post_init__(self, content_type: str | None, cookies: BaseCookie[bytes] | None, content: Iterable[bytes] | AsyncIterable[bytes]) -> None:
+        self.stream = content
+        return super().__post_init__(content_type, cookies)
+
+    async def iter_body(self) -> AsyncIterator[bytes]:
+        async for chunk in _aiter(self.stream):
+            yield chunk
+
+
+@dataclass
+class JSONStreamResponse(StreamingResponse):
+    """Stream `content` items as an incrementally encoded JSON array."""
+    content: InitVar[Iterable[Any] | AsyncIterable[Any]] = ()
+    encoder: InitVar[JSONEncoder | None] = None
+    chunk_size: InitVar[int] = 65536
+    batch_size: InitVar[int] = 256
+    media_type: ClassVar[str] = "application/json"
+
+    def __post_init__(self, content_type: str | None, cookies: BaseCookie[bytes] | None, content: Iterable[Any] | AsyncIterable[Any], encoder: JSONEncoder | None, chunk_size: int, batch_size: int) -> None:
+        return super().__post_init__(
+            self.media_type if content_type is None else content_type,
+            cookies,
+            self.encode_stream(content, encoder, chunk_size, batch_size),
+        )
+
+    def encode_stream(self, items: Iterable[Any] | AsyncIterable[Any], encoder: JSONEncoder | None, chunk_size: int, batch_size: int) -> AsyncIterator[bytes]:
+        return iter_json_array(items, encoder, chunk_size, batch_size)
+
+
+@dataclass
+class NDJSONResponse(JSONStreamResponse):
+    """Stream `content` items as newline-delimited JSON. Items are encoded one by one, so `batch_size` is unused."""
+    media_type: ClassVar[str] = "application/x-ndjson"
+
+    @override
+    def encode_stream(self, items: Iterable[Any] | AsyncIterable[Any], encoder: JSONEncoder | None, chunk_size: int, batch_size: int) -> AsyncIterator[bytes]:
+        return iter_ndjson(items, encoder, chunk_size)
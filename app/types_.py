@@ -21,6 +21,9 @@ type AsyncCallable[**P, R] = Callable[P, Awaitable[R]]
 type AnyAsyncCallable = AsyncCallable[..., Any]
 type RouteMapping[R] = MutableMapping[str, AsyncCallable[..., R]]
 
+type JSONEncoder = Callable[[Any], bytes]
+type JSONDecoder = Callable[[bytes], Any]
+
 
 class ASGIInfo(TypedDict):
     version: str
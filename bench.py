@@ -0,0 +1,52 @@
+import asyncio
+import json
+import timeit
+from typing import Any
+
+from app.subroutines.http import iter_json_array, iter_ndjson, std_json_dumps
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_payload(n: int) -> list[dict[str, Any]]:
+    return [
+        {"id": i, "name": f"item-{i}", "price": i * 1.25, "tags": ["a", "b", "ü"], "active": i % 2 == 0}
+        for i in range(n)
+    ]
+
+
+async def drain(chunks: Any) -> int:
+    return sum([len(c) async for c in chunks])
+
+
+def bench(label: str, fn: Any, number: int) -> None:
+    t = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<40} {t * 1e6:>12.1f} us")
+
+
+def main() -> None:
+    encoders: dict[str, Any] = {
+        "json.dumps().encode()": lambda o: json.dumps(o).encode(),  # pyright: ignore[reportUnknownLambdaType]
+        "stdlib (cached encoder)": std_json_dumps,
+    }
+    if orjson is not None:
+        encoders["orjson"] = orjson.dumps
+
+    loop = asyncio.new_event_loop()
+    for n in (1, 100, 10_000, 100_000):
+        payload = make_payload(n)
+        number = max(1, 100_000 // (n * 10))
+        print(f"{n} items ({len(std_json_dumps(payload))} bytes), {number} loops:")
+        for label, dumps in encoders.items():
+            bench(label, lambda: dumps(payload), number)
+        for label, dumps in encoders.items():
+            bench(f"{label} [array stream]", lambda: loop.run_until_complete(drain(iter_json_array(payload, dumps))), number)
+            bench(f"{label} [ndjson stream]", lambda: loop.run_until_complete(drain(iter_ndjson(payload, dumps))), number)
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from typing import Any, TextIO
 from app import App
 from app.components.http import HTTPComponent
 from app.components.lifespan import LifespanComponent
-from app.subroutines.http import HTMLResponse
+from app.subroutines.http import HTMLResponse, JSONResponse, SimpleRequest
 
 app = App()
 
@@ -42,3 +42,8 @@ async def teapot() -> HTMLResponse:
     _ = log.write("teapot\n")
     log.flush()
     return HTMLResponse(status=418, content=resp)
+
+
+@http.post("/echo")
+async def echo(request: SimpleRequest) -> JSONResponse:
+    return JSONResponse(content=request.json())
@@ -0,0 +1,202 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Iterable
+from typing import Any, final
+
+from app.components.http import HTTPComponent
+from app.exceptions import ParseError
+from app.subroutines.http import (
+    JSONResponse,
+    JSONStreamResponse,
+    NDJSONResponse,
+    SimpleRequest,
+    StreamingResponse,
+    iter_json_array,
+    iter_ndjson,
+    std_json_dumps,
+)
+from app.types_ import CommonMapping
+
+
+async def collect(chunks: Any) -> list[bytes]:
+    return [c async for c in chunks]
+
+
+async def arange(n: int) -> AsyncGenerator[int, None]:
+    for i in range(n):
+        yield i
+
+
+def request_with(*parts: bytes, more_body: bool = False) -> SimpleRequest:
+    req = SimpleRequest()
+    for i, part in enumerate(parts):
+        _ = req.receive({"type": "http.request", "body": part, "more_body": more_body or i < len(parts) - 1})
+    return req
+
+
+def test_json_array_framing() -> None:
+    for n in (0, 1, 3, 255, 256, 257, 1000):
+        for chunk_size in (1, 64, 65536):
+            for batch_size in (1, 7, 256):
+                chunks = asyncio.run(collect(iter_json_array(range(n), chunk_size=chunk_size, batch_size=batch_size)))
+                assert json.loads(b"".join(chunks)) == list(range(n)), (n, chunk_size, batch_size)
+                assert all(len(c) == chunk_size for c in chunks[:-1]) and 0 < len(chunks[-1]) <= chunk_size
+    assert asyncio.run(collect(iter_json_array([]))) == [b"[]"]
+    assert json.loads(b"".join(asyncio.run(collect(iter_json_array(arange(600)))))) == list(range(600))
+
+
+def test_json_stream_response_chunks() -> None:
+    items = [{"data": "x" * 1000}] * 300
+    resp = JSONStreamResponse(content=items, chunk_size=4096, batch_size=10)
+    chunks = asyncio.run(collect(resp.iter_body()))
+    assert all(len(c) == 4096 for c in chunks[:-1]) and len(chunks[-1]) <= 4096
+    assert json.loads(b"".join(chunks)) == items
+
+
+def test_json_array_custom_encoder() -> None:
+    def newline(o: Any) -> bytes:
+        return (json.dumps(o) + "\n").encode()
+
+    def unframed(o: Any) -> bytes:
+        return b"X" + json.dumps(o).encode() if isinstance(o, list) else json.dumps(o).encode()
+
+    for encoder in (newline, unframed):
+        out = b"".join(asyncio.run(collect(iter_json_array(range(600), encoder))))
+        assert json.loads(out) == list(range(600))
+
+
+def test_ndjson_framing() -> None:
+    items: Iterable[Any] = [{"a": 1}, [], "x", None]
+    out = b"".join(asyncio.run(collect(iter_ndjson(items, chunk_size=8))))
+    assert out.endswith(b"\n")
+    assert [json.loads(line) for line in out.splitlines()] == items
+    assert asyncio.run(collect(iter_ndjson([]))) == []
+    big = ["x" * 1000] * 10
+    chunks = asyncio.run(collect(iter_ndjson(big, chunk_size=300)))
+    assert all(len(c) == 300 for c in chunks[:-1]) and len(chunks[-1]) <= 300
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == big
+    assert asyncio.run(collect(iter_ndjson(arange(3), lambda o: (json.dumps(o) + "\n").encode()))) == [b"0\n1\n2\n"]
+
+
+def test_std_json_dumps() -> None:
+    assert json.loads(std_json_dumps({"a": float("nan"), "b": [float("inf"), (1.5,)]})) == {"a": None, "b": [None, [1.5]]}
+    assert std_json_dumps({"b": "ü\ud800"}) == '{"b":"ü\\ud800"}'.encode()
+    assert json.loads(std_json_dumps("\ud800é")) == "\ud800é"
+    shared = [float("nan")]
+    assert std_json_dumps([shared, shared]) == b"[[null],[null]]"
+    loop: list[Any] = []
+    loop.append(loop)
+    try:
+        _ = std_json_dumps(loop)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("circular reference was encoded")
+
+
+def test_responses() -> None:
+    resp = JSONResponse(content={"a": [1, "é"]})
+    assert resp.body is not None and json.loads(resp.body) == {"a": [1, "é"]}
+    assert resp.headers == {"content-length": len(resp.body), "content-type": "application/json"}
+    assert JSONStreamResponse(content=[]).headers == {"content-type": "application/json"}
+    assert NDJSONResponse(content=[]).headers == {"content-type": "application/x-ndjson"}
+    try:
+        _ = StreamingResponse(body=b"x")  # pyright: ignore[reportCallIssue]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("StreamingResponse accepted body")
+
+
+def test_request_json() -> None:
+    assert request_with(b'{"a":', b"[1]}").json() == {"a": [1]}
+    for req in (request_with(b"{", more_body=True), request_with(b"{"), request_with(b"")):
+        try:
+            _ = req.json()
+        except ParseError:
+            pass
+        else:
+            raise AssertionError(f"decoded {req.body!r}")
+
+
+def test_handle() -> None:
+    http = HTTPComponent()
+
+    @http.post("/echo")
+    async def echo(request: SimpleRequest) -> JSONResponse:
+        return JSONResponse(content=request.json())
+
+    @http.get("/items")
+    async def items() -> JSONStreamResponse:
+        return JSONStreamResponse(content=arange(1000), chunk_size=256)
+
+    async def run(method: str, path: str, *parts: bytes) -> list[CommonMapping]:
+        sent: list[CommonMapping] = []
+        received = iter([{"type": "http.request", "body": p, "more_body": i < len(parts) - 1} for i, p in enumerate(parts)])
+
+        async def receive() -> Any:
+            return next(received)
+
+        async def send(message: CommonMapping) -> None:
+            sent.append(message)
+
+        await http.handle({"method": method, "path": path}, receive, send)  # pyright: ignore[reportArgumentType]
+        return sent
+
+    @http.get("/page")
+    async def page(n: int = 1) -> JSONResponse:
+        return JSONResponse(content=n)
+
+    @final
+    class Unhashable:
+        __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+        async def __call__(self, *, req: SimpleRequest) -> JSONResponse:
+            return JSONResponse(content=len(req.body))
+
+    _ = http.post("/unhashable")(Unhashable())
+
+    sent = asyncio.run(run("POST", "/echo", b'{"a":', b"1}"))
+    assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
+    assert json.loads(sent[1]["body"]) == {"a": 1}
+
+    assert json.loads(asyncio.run(run("GET", "/page", b""))[1]["body"]) == 1
+    assert json.loads(asyncio.run(run("POST", "/unhashable", b"abc"))[1]["body"]) == 3
+
+    sent = asyncio.run(run("GET", "/items", b""))
+    assert sent[0]["type"] == "http.response.start"
+    assert (b"content-type", b"application/json") in sent[0]["headers"]
+    assert all(k != b"content-length" for k, _ in sent[0]["headers"])
+    bodies = sent[1:]
+    assert len(bodies) > 2
+    assert all(m["more_body"] for m in bodies[:-1]) and not bodies[-1]["more_body"]
+    assert json.loads(b"".join(m["body"] for m in bodies)) == list(range(1000))
+
+
+def test_handle_bad_json() -> None:
+    http = HTTPComponent()
+
+    @http.post("/echo")
+    async def echo(request: SimpleRequest) -> JSONResponse:
+        return JSONResponse(content=request.json())
+
+    for body in (b"{", b""):
+        sent: list[CommonMapping] = []
+        received = iter([{"type": "http.request", "body": body}])
+
+        async def receive() -> Any:
+            return next(received)
+
+        async def send(message: CommonMapping) -> None:
+            sent.append(message)
+
+        asyncio.run(http.handle({"method": "POST", "path": "/echo"}, receive, send))  # pyright: ignore[reportArgumentType]
+        assert sent[0]["type"] == "http.response.start" and sent[0]["status"] == 400
+        assert sent[1]["body"] == b"400 Bad Request\n" and not sent[1]["more_body"]
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            _ = fn()
+            print(f"{name}: ok")